@@ -4,10 +4,16 @@ Each node performs a specific task and updates the state
 """
 
 from app.agent.state import ResearchState
+from app.core.config import settings
+from app.core.dedup import find_duplicates
 from app.chains import get_planning_chain, get_summary_chain, get_report_chain
 from app.tools import WebSearchTool, WebScraperTool
-from typing import Dict
+from typing import Dict, List, Optional
 import asyncio
+import logging
+
+
+log = logging.getLogger("research")
 
 
 class ResearchNodes:
@@ -34,7 +40,7 @@ class ResearchNodes:
         Returns:
             Updated state with plan and queries
         """
-        print(f"🧠 PLANNING: Analyzing topic '{state['topic']}'...")
+        log.info(f"🧠 PLANNING: Analyzing topic '{state['topic']}'...")
         
         try:
             # Determine number of queries based on depth
@@ -51,7 +57,7 @@ class ResearchNodes:
                 num_queries=num_queries
             )
             
-            print(f"✅ Generated {len(queries)} search queries")
+            log.info(f"✅ Generated {len(queries)} search queries")
             
             return {
                 "search_queries": queries,
@@ -59,7 +65,7 @@ class ResearchNodes:
             }
             
         except Exception as e:
-            print(f"❌ Planning error: {str(e)}")
+            log.error(f"❌ Planning error: {str(e)}")
             return {
                 "error": f"Planning failed: {str(e)}",
                 "should_continue": False
@@ -75,34 +81,38 @@ class ResearchNodes:
         Returns:
             Updated state with search results
         """
-        print(f"🔍 SEARCHING: Executing {len(state['search_queries'])} queries...")
+        log.info(f"🔍 SEARCHING: Executing {len(state['search_queries'])} queries...")
         
         try:
-            all_results = []
+            # Bound concurrency to stay within API rate limits
+            semaphore = asyncio.Semaphore(settings.MAX_CONCURRENCY)
             
-            # Execute each query
-            for i, query in enumerate(state['search_queries'], 1):
-                print(f"   Query {i}/{len(state['search_queries'])}: {query}")
-                
-                results = self.searcher.search(query, max_results=2)
-                all_results.extend(results)
-                
-                # Small delay to be respectful to API
-                await asyncio.sleep(0.5)
+            async def _run(query: str) -> List[Dict]:
+                async with semaphore:
+                    log.info(f"   Query: {query}")
+                    return await asyncio.to_thread(self.searcher.search, query, 2)
+            
+            # Execute all queries concurrently
+            results_lists = await asyncio.gather(
+                *[_run(query) for query in state['search_queries']],
+                return_exceptions=True
+            )
             
-            # Remove duplicates based on URL
-            unique_results = []
-            seen_urls = set()
-            for result in all_results:
-                url = result.get('url', '')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_results.append(result)
+            all_results = []
+            for results in results_lists:
+                if isinstance(results, Exception):
+                    log.warning(f"   ✗ Query failed: {str(results)}")
+                    continue
+                all_results.extend(results)
             
-            # Limit to max_sources
-            unique_results = unique_results[:state['max_sources']]
+            # Remove duplicates based on URL (dicts preserve insertion order)
+            # and limit to max_sources. Fragments are ignored so anchors into
+            # the same page aren't scraped and summarized twice.
+            unique_results = list(
+                {r['url'].partition('#')[0]: r for r in all_results if r.get('url')}.values()
+            )[:state['max_sources']]
             
-            print(f"✅ Found {len(unique_results)} unique sources")
+            log.info(f"✅ Found {len(unique_results)} unique sources")
             
             return {
                 "search_results": unique_results,
@@ -111,7 +121,7 @@ class ResearchNodes:
             }
             
         except Exception as e:
-            print(f"❌ Search error: {str(e)}")
+            log.error(f"❌ Search error: {str(e)}")
             return {
                 "error": f"Search failed: {str(e)}",
                 "should_continue": False
@@ -127,31 +137,36 @@ class ResearchNodes:
         Returns:
             Updated state with scraped content
         """
-        print(f"🕷️  SCRAPING: Extracting content from {len(state['search_results'])} pages...")
+        log.info(f"🕷️  SCRAPING: Extracting content from {len(state['search_results'])} pages...")
         
         try:
-            scraped_pages = []
+            # Bound concurrent scrapes to avoid hammering remote hosts
+            semaphore = asyncio.Semaphore(settings.MAX_CONCURRENCY)
             
-            for i, result in enumerate(state['search_results'], 1):
-                url = result.get('url', '')
-                if not url:
-                    continue
-                
-                print(f"   Scraping {i}/{len(state['search_results'])}: {url[:50]}...")
-                
-                # Scrape page
-                content = self.scraper.scrape(url)
-                
-                if content.get('success'):
+            async def _scrape(url: str) -> Dict:
+                async with semaphore:
+                    log.info(f"   Scraping: {url[:50]}...")
+                    return await asyncio.to_thread(self.scraper.scrape, url)
+            
+            # Scrape all pages concurrently
+            tasks = [
+                _scrape(result['url'])
+                for result in state['search_results']
+                if result.get('url')
+            ]
+            contents = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            scraped_pages = []
+            for content in contents:
+                if isinstance(content, Exception):
+                    log.warning(f"   ✗ Failed: {str(content)}")
+                elif content.get('success'):
                     scraped_pages.append(content)
-                    print(f"   ✓ Success ({content.get('word_count', 0)} words)")
+                    log.info(f"   ✓ Success ({content.get('word_count', 0)} words)")
                 else:
-                    print(f"   ✗ Failed: {content.get('error', 'Unknown error')}")
-                
-                # Small delay
-                await asyncio.sleep(0.5)
+                    log.warning(f"   ✗ Failed: {content.get('error', 'Unknown error')}")
             
-            print(f"✅ Successfully scraped {len(scraped_pages)}/{len(state['search_results'])} pages")
+            log.info(f"✅ Successfully scraped {len(scraped_pages)}/{len(state['search_results'])} pages")
             
             return {
                 "scraped_content": scraped_pages,
@@ -160,7 +175,7 @@ class ResearchNodes:
             }
             
         except Exception as e:
-            print(f"❌ Scraping error: {str(e)}")
+            log.error(f"❌ Scraping error: {str(e)}")
             return {
                 "error": f"Scraping failed: {str(e)}",
                 "should_continue": False
@@ -176,18 +191,59 @@ class ResearchNodes:
         Returns:
             Updated state with summaries
         """
-        print(f"📝 SUMMARIZING: Processing {len(state['scraped_content'])} pages...")
+        log.info(f"📝 SUMMARIZING: Processing {len(state['scraped_content'])} pages...")
         
         try:
-            # Summarize all content
-            summaries = await self.summarizer.summarize_multiple(
-                topic=state['topic'],
-                sources=state['scraped_content']
-            )
+            # Short pages are already summary-sized - skip the LLM for them
+            threshold = settings.SUMMARY_SKIP_THRESHOLD
+            long_pages = [
+                c for c in state['scraped_content']
+                if c.get('word_count', 0) >= threshold
+            ]
+            
+            # Near-duplicate pages (mirrors, syndicated articles) are
+            # summarized once and the summary is shared by the group
+            groups = find_duplicates([c.get('content', '') for c in long_pages])
+            representatives = sorted(set(groups))
+            
+            # Summarize long content, several sources per LLM call
+            rep_summaries = dict(zip(
+                representatives,
+                await self.summarizer.summarize_batch(
+                    topic=state['topic'],
+                    sources=[long_pages[i] for i in representatives],
+                    batch_size=settings.SUMMARY_BATCH_SIZE
+                )
+            ))
+            long_summaries = iter([
+                {
+                    **rep_summaries[rep],
+                    "url": page.get('url', ''),
+                    "title": page.get('title', '')
+                }
+                for page, rep in zip(long_pages, groups)
+            ])
+            
+            # Merge back in the original source order
+            summaries = []
+            for c in state['scraped_content']:
+                if c.get('word_count', 0) >= threshold:
+                    summaries.append(next(long_summaries))
+                else:
+                    summaries.append({
+                        "success": True,
+                        "topic": state['topic'],
+                        "url": c.get('url', ''),
+                        "title": c.get('title', ''),
+                        "summary": c.get('content', '')[:2000]
+                    })
+            
+            log.info(f"   Skipped LLM for {len(summaries) - len(long_pages)} short pages")
+            log.info(f"   Skipped LLM for {len(long_pages) - len(representatives)} duplicate pages")
             
             successful_summaries = [s for s in summaries if s.get('success')]
             
-            print(f"✅ Created {len(successful_summaries)} summaries")
+            log.info(f"✅ Created {len(successful_summaries)} summaries")
             
             return {
                 "summaries": summaries,
@@ -195,7 +251,7 @@ class ResearchNodes:
             }
             
         except Exception as e:
-            print(f"❌ Summarization error: {str(e)}")
+            log.error(f"❌ Summarization error: {str(e)}")
             return {
                 "error": f"Summarization failed: {str(e)}",
                 "should_continue": False
@@ -211,7 +267,7 @@ class ResearchNodes:
         Returns:
             Updated state with final report
         """
-        print(f"📄 GENERATING REPORT: Synthesizing findings...")
+        log.info(f"📄 GENERATING REPORT: Synthesizing findings...")
         
         try:
             # Generate report
@@ -221,12 +277,13 @@ class ResearchNodes:
             )
             
             if report_result.get('success'):
-                print(f"✅ Report generated ({report_result.get('word_count', 0)} words)")
+                log.info(f"✅ Report generated ({report_result.get('word_count', 0)} words)")
                 
                 return {
                     "final_report": report_result.get('report'),
                     "report_metadata": {
                         "word_count": report_result.get('word_count'),
+                        "time_to_first_token": report_result.get('time_to_first_token'),
                         "num_sources": report_result.get('num_sources'),
                         "generated_at": report_result.get('generated_at'),
                         "sources": report_result.get('sources', [])
@@ -238,7 +295,7 @@ class ResearchNodes:
                 raise Exception(report_result.get('error', 'Unknown error'))
                 
         except Exception as e:
-            print(f"❌ Report generation error: {str(e)}")
+            log.error(f"❌ Report generation error: {str(e)}")
             return {
                 "error": f"Report generation failed: {str(e)}",
                 "should_continue": False,
@@ -246,6 +303,24 @@ class ResearchNodes:
             }
 
 
+# ResearchNodes keeps no per-run state (concurrency limits are created per
+# node call), so one instance can be shared by every graph that is built
+_NODES: Optional[ResearchNodes] = None
+
+
+def get_nodes() -> ResearchNodes:
+    """
+    Get a shared ResearchNodes instance for building workflow graphs
+    
+    Returns:
+        ResearchNodes, created on first use
+    """
+    global _NODES
+    if _NODES is None:
+        _NODES = ResearchNodes()
+    return _NODES
+
+
 # Helper function to check if we should continue
 def should_continue_research(state: ResearchState) -> str:
     """
@@ -13,7 +13,7 @@ class ResearchState(TypedDict):
 
     topic : str
     depth : str
-    max_sources : str
+    max_sources : int
 
 
     research_plan: Optional[str]        
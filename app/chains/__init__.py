@@ -5,20 +5,24 @@ Chains Manager - Central access to all chains
 from app.chains.planning_chain import PlanningChain
 from app.chains.summary_chain import SummaryChain
 from app.chains.report_chain import ReportChain
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_planning_chain() -> PlanningChain:
-    """Get planning chain instance"""
+    """Get planning chain instance (shared process-wide)"""
     return PlanningChain()
 
 
+@lru_cache(maxsize=1)
 def get_summary_chain() -> SummaryChain:
-    """Get summary chain instance"""
+    """Get summary chain instance (shared process-wide)"""
     return SummaryChain()
 
 
+@lru_cache(maxsize=1)
 def get_report_chain() -> ReportChain:
-    """Get report chain instance"""
+    """Get report chain instance (shared process-wide)"""
     return ReportChain()
 
 
@@ -10,6 +10,14 @@ from typing import Dict, List
 import re
 
 
+# Matches a plan line that looks like a search query, compiled once at import.
+# Skips markdown headers, drops leading numbers/bullets, rejects lines with colons.
+_QUERY_LINE_RE = re.compile(
+    r'^(?![^\S\n]*#)[^\S\n]*(?:[\d\.\-\*\)]+[^\S\n]*)?(?P<query>[^:\n]*?)[^\S\n]*$',
+    re.MULTILINE
+)
+
+
 class PlanningChain:
     """
     Creates a research plan for a given topic
@@ -17,7 +25,7 @@ class PlanningChain:
     
     def __init__(self):
         """Initialize the planning chain"""
-        self.llm = get_llm()
+        self.llm = get_llm(temperature=0)  # Deterministic so cached responses are reusable
         self.prompt = get_planner_prompt()
         self.quick_prompt = get_quick_planner_prompt()
         
@@ -116,23 +124,13 @@ class PlanningChain:
         """
         queries = []
         
-        # Look for lines that look like search queries
-        # Usually they're numbered or bulleted
-        lines = plan.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines and headers
-            if not line or line.startswith('#'):
-                continue
-            
-            # Remove common prefixes (numbers, bullets)
-            cleaned = re.sub(r'^[\d\.\-\*\)]+\s*', '', line)
-            cleaned = cleaned.strip('"\'')
+        # Single pass over the plan: candidate lines are non-header lines,
+        # optionally numbered or bulleted, without colons
+        for match in _QUERY_LINE_RE.finditer(plan):
+            cleaned = match.group('query').strip().strip('"\'')
             
-            # If it looks like a query (not too long, no colons suggesting headers)
-            if cleaned and len(cleaned) < 100 and ':' not in cleaned:
+            # If it looks like a query (not too long)
+            if cleaned and len(cleaned) < 100:
                 queries.append(cleaned)
             
             if len(queries) >= max_queries:
@@ -2,11 +2,21 @@
 Report Chain - Generates final research report
 """
 
+from langchain_core.globals import get_llm_cache
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage
 from langchain_core.output_parsers import StrOutputParser
-from app.core.llm import get_llm
+from langchain_core.outputs import ChatGeneration
+from app.core.config import settings
+from app.core.llm import get_llm, stream_retrying, CHARS_PER_TOKEN
 from app.prompts.report_prompt import get_report_prompt
-from typing import Dict, List
-from datetime import datetime
+from typing import AsyncIterator, Dict, List
+from datetime import datetime, timezone
+import logging
+import time
+
+
+log = logging.getLogger("research")
 
 
 class ReportChain:
@@ -38,18 +48,37 @@ class ReportChain:
             Dictionary with report and metadata
         """
         try:
-            # Format summaries for the prompt
-            formatted_summaries = self._format_summaries(summaries)
+            parts = []
             
-            # Generate report
-            report = await self.chain.ainvoke({
-                "topic": topic,
-                "num_sources": len(summaries),
-                "summaries": formatted_summaries
-            })
+            # The client retries failed requests; a stream that breaks
+            # part-way is restarted from scratch
+            async for attempt in stream_retrying(lambda: bool(parts)):
+                with attempt:
+                    started = time.perf_counter()
+                    time_to_first_token = None
+                    
+                    # Accumulate streamed chunks, counting words as they arrive
+                    # so the report isn't re-scanned afterwards
+                    parts.clear()
+                    word_count = 0
+                    in_word = False
+                    
+                    async for chunk in self.stream_report(topic, summaries):
+                        if not chunk:
+                            continue
+                        if time_to_first_token is None:
+                            time_to_first_token = time.perf_counter() - started
+                        
+                        chunk_words = len(chunk.split())
+                        # A word split across two chunks is only counted once
+                        if in_word and not chunk[0].isspace():
+                            chunk_words -= 1
+                        word_count += chunk_words
+                        in_word = not chunk[-1].isspace()
+                        
+                        parts.append(chunk)
             
-            # Add metadata
-            word_count = len(report.split())
+            report = "".join(parts)
             
             return {
                 "success": True,
@@ -57,7 +86,8 @@ class ReportChain:
                 "report": report,
                 "num_sources": len(summaries),
                 "word_count": word_count,
-                "generated_at": datetime.now().isoformat(),
+                "time_to_first_token": time_to_first_token,
+                "generated_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
                 "sources": self._extract_source_list(summaries)
             }
             
@@ -67,6 +97,59 @@ class ReportChain:
                 "error": str(e)
             }
     
+    async def stream_report(
+        self,
+        topic: str,
+        summaries: List[Dict]
+    ) -> AsyncIterator[str]:
+        """
+        Stream the research report as it is generated
+        
+        Args:
+            topic: Research topic
+            summaries: List of summary dictionaries
+            
+        Yields:
+            Report text chunks in generation order
+        """
+        # Format summaries for the prompt
+        formatted_summaries = self._format_summaries(summaries)
+        inputs = {
+            "topic": topic,
+            "num_sources": len(summaries),
+            "summaries": formatted_summaries
+        }
+        
+        # astream() bypasses the global LLM cache, so look it up (and fill
+        # it) here under the same key ainvoke() would use
+        cache = get_llm_cache()
+        if cache is not None:
+            prompt = dumps(self.prompt.format_messages(**inputs))
+            llm_string = self.llm._get_llm_string()
+            try:
+                cached = await cache.alookup(prompt, llm_string)
+            except Exception as e:
+                # The cache is only an optimization - generate uncached
+                log.warning(f"LLM cache lookup failed: {e}")
+                cache = cached = None
+            if cached:
+                yield cached[0].text
+                return
+        
+        parts = []
+        async for chunk in self.chain.astream(inputs):
+            parts.append(chunk)
+            yield chunk
+        
+        # Only a fully consumed stream is a complete report worth caching
+        if cache is not None:
+            try:
+                await cache.aupdate(prompt, llm_string, [
+                    ChatGeneration(message=AIMessage(content="".join(parts)))
+                ])
+            except Exception as e:
+                log.warning(f"LLM cache update failed: {e}")
+    
     def _format_summaries(self, summaries: List[Dict]) -> str:
         """
         Format summaries into a single string for the prompt
@@ -79,8 +162,19 @@ class ReportChain:
         """
         formatted = []
         
+        # Keep the prompt within budget - prefill time grows with input size
+        texts = {
+            i: summary.get('summary', 'No summary available')
+            for i, summary in enumerate(summaries, 1)
+            if summary.get('success', False)
+        }
+        caps = self._summary_char_caps(
+            {i: len(text) for i, text in texts.items()},
+            settings.REPORT_MAX_INPUT_TOKENS * CHARS_PER_TOKEN
+        )
+        
         for i, summary in enumerate(summaries, 1):
-            if not summary.get('success', False):
+            if i not in texts:
                 continue
             
             formatted.append(f"""
@@ -88,13 +182,58 @@ Source {i}:
 Title: {summary.get('title', 'Untitled')}
 URL: {summary.get('url', 'N/A')}
 Summary:
-{summary.get('summary', 'No summary available')}
+{self._truncate_summary(texts[i], caps[i])}
 
 ---
 """)
         
         return "\n".join(formatted)
     
+    def _summary_char_caps(self, lengths: Dict[int, int], budget: int) -> Dict[int, int]:
+        """
+        Split a character budget across summaries
+        
+        Short summaries keep their full length and hand their unused
+        share to longer ones; only the longest get truncated.
+        
+        Args:
+            lengths: Summary length keyed by source index
+            budget: Total characters allowed for all summaries
+            
+        Returns:
+            Maximum characters keyed by source index
+        """
+        caps = {}
+        remaining = budget
+        slots_left = len(lengths)
+        
+        for i, length in sorted(lengths.items(), key=lambda item: item[1]):
+            caps[i] = min(length, remaining // slots_left)
+            remaining -= caps[i]
+            slots_left -= 1
+        
+        return caps
+    
+    def _truncate_summary(self, text: str, max_chars: int) -> str:
+        """
+        Shorten a summary by keeping its head and tail
+        
+        Args:
+            text: Summary text
+            max_chars: Maximum characters to keep
+            
+        Returns:
+            Original text if it fits, otherwise head + marker + tail
+        """
+        if len(text) <= max_chars:
+            return text
+        
+        # Opening points and closing conclusions carry the most signal
+        head = text[:max_chars * 2 // 3].rsplit(' ', 1)[0]
+        tail = text[len(text) - max_chars // 3:].split(' ', 1)[-1]
+        
+        return f"{head} ...[truncated]... {tail}"
+    
     def _extract_source_list(self, summaries: List[Dict]) -> List[Dict]:
         """
         Extract clean list of sources for metadata
@@ -2,10 +2,14 @@
 Summary Chain - Summarizes web content
 """
 
-from langchain_core.output_parsers import StrOutputParser
-from app.core.llm import get_llm
-from app.prompts.summarizer_prompt import get_summarizer_prompt
-from typing import Dict
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
+from app.core.config import settings
+from app.core.llm import get_llm, get_embeddings, CHARS_PER_TOKEN
+from app.core.semantic_cache import SemanticCache
+from app.prompts.summarizer_prompt import get_summarizer_prompt, get_batch_summarizer_prompt
+from typing import Dict, List, Optional, Tuple
+import asyncio
 
 class SummaryChain:
     """
@@ -14,11 +18,19 @@ class SummaryChain:
     
     def __init__(self):
         """Initialize the summary chain"""
-        self.llm = get_llm()
+        self.llm = get_llm(temperature=0)  # Deterministic so cached responses are reusable
         self.prompt = get_summarizer_prompt()
+        self.batch_prompt = get_batch_summarizer_prompt()
         
-        # Create chain
+        # Create chains
         self.chain = self.prompt | self.llm | StrOutputParser()
+        self.batch_chain = self.batch_prompt | self.llm | JsonOutputParser()
+        
+        # Near-duplicate content (syndicated stories, mirrors) reuses summaries
+        self.semantic_cache = (
+            SemanticCache(get_embeddings(), threshold=settings.SEMANTIC_CACHE_THRESHOLD)
+            if settings.SEMANTIC_CACHE_ENABLED else None
+        )
     
     async def summarize(
         self,
@@ -63,6 +75,205 @@ class SummaryChain:
                 "url": url,
                 "title": title
             }
+    
+    async def summarize_batch(
+        self,
+        topic: str,
+        sources: List[Dict],
+        batch_size: int = 4
+    ) -> List[Dict]:
+        """
+        Summarize sources several at a time, one LLM call per batch
+        
+        Sources matching the semantic cache are answered from it; the rest
+        are batched. Batches run concurrently. A batch whose response can't
+        be parsed falls back to per-source summarization for the missing
+        sources; a batch whose request fails reports every source as failed.
+        
+        Args:
+            topic: Research topic
+            sources: List of scraped content dictionaries
+            batch_size: Number of sources packed into each prompt
+            
+        Returns:
+            List of summary dictionaries, in the same order as sources
+        """
+        # Cap parallel LLM calls to respect Gemini rate limits
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENCY)
+        
+        async def _batch(batch: List[Dict]) -> List[Dict]:
+            if len(batch) == 1:
+                async with semaphore:
+                    return [await self._summarize_source(topic, batch[0])]
+            
+            try:
+                async with semaphore:
+                    parsed = await self.batch_chain.ainvoke({
+                        "topic": topic,
+                        "num_sources": len(batch),
+                        "sources": self._format_batch(batch)
+                    })
+            except OutputParserException:
+                # Malformed JSON - recover the sources one by one below
+                parsed = {}
+            except Exception as e:
+                # The request itself failed (client retries already spent);
+                # per-source calls would just repeat it once per source
+                return [
+                    {
+                        "success": False,
+                        "error": str(e),
+                        "url": source.get('url', ''),
+                        "title": source.get('title', '')
+                    }
+                    for source in batch
+                ]
+            
+            if not isinstance(parsed, dict):
+                parsed = {}
+            
+            async def _result(i: int, source: Dict) -> Dict:
+                summary = parsed.get(f"source_{i}")
+                if isinstance(summary, str) and summary.strip():
+                    return {
+                        "success": True,
+                        "topic": topic,
+                        "url": source.get('url', ''),
+                        "title": source.get('title', ''),
+                        "summary": summary
+                    }
+                
+                # Fallback for sources the batch response didn't cover
+                async with semaphore:
+                    return await self._summarize_source(topic, source)
+            
+            return await asyncio.gather(
+                *[_result(i, source) for i, source in enumerate(batch, 1)]
+            )
+        
+        # Reuse summaries of near-duplicate content seen before
+        lookups = await asyncio.gather(
+            *[self._cache_lookup(topic, source) for source in sources]
+        )
+        misses = [
+            source for source, (hit, _) in zip(sources, lookups)
+            if hit is None
+        ]
+        
+        batches = self._make_batches(
+            misses, batch_size, settings.SUMMARY_BATCH_MAX_TOKENS * CHARS_PER_TOKEN
+        )
+        batch_results = await asyncio.gather(*[_batch(batch) for batch in batches])
+        miss_results = iter(
+            [summary for results in batch_results for summary in results]
+        )
+        
+        # Merge back in source order, caching fresh summaries
+        summaries = []
+        for source, (hit, vector) in zip(sources, lookups):
+            if hit is not None:
+                summaries.append(self._cached_result(topic, source, hit))
+            else:
+                result = next(miss_results)
+                self._cache_add(vector, result)
+                summaries.append(result)
+        
+        return summaries
+    
+    async def _cache_lookup(self, topic: str, source: Dict) -> Tuple[Optional[str], object]:
+        """Look up a source in the semantic cache; (None, None) when disabled"""
+        if self.semantic_cache is None:
+            return None, None
+        return await self.semantic_cache.lookup(topic, source.get('content', ''))
+    
+    def _cache_add(self, vector, result: Dict) -> None:
+        """Store a successful summary in the semantic cache"""
+        if self.semantic_cache is not None and result.get('success'):
+            self.semantic_cache.add(vector, result['summary'])
+    
+    def _cached_result(self, topic: str, source: Dict, summary: str) -> Dict:
+        """Build a summary dictionary from a semantic cache hit"""
+        return {
+            "success": True,
+            "topic": topic,
+            "url": source.get('url', ''),
+            "title": source.get('title', ''),
+            "summary": summary,
+            "cached": True
+        }
+    
+    def _make_batches(
+        self,
+        sources: List[Dict],
+        batch_size: int,
+        max_chars: int
+    ) -> List[List[Dict]]:
+        """
+        Group sources into batches, keeping their order
+        
+        A batch closes when it reaches batch_size sources or adding the next
+        source would exceed max_chars of content. A source too large for
+        any batch is summarized alone with the single-source prompt.
+        
+        Args:
+            sources: List of scraped content dictionaries
+            batch_size: Maximum sources per batch
+            max_chars: Maximum content characters per batch
+            
+        Returns:
+            List of batches
+        """
+        batches = []
+        current = []
+        current_chars = 0
+        
+        for source in sources:
+            chars = len(source.get('content', ''))
+            if current and (
+                len(current) >= batch_size or current_chars + chars > max_chars
+            ):
+                batches.append(current)
+                current = []
+                current_chars = 0
+            current.append(source)
+            current_chars += chars
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    async def _summarize_source(self, topic: str, source: Dict) -> Dict:
+        """Summarize a single scraped content dictionary"""
+        return await self.summarize(
+            topic=topic,
+            content=source.get('content', ''),
+            url=source.get('url', ''),
+            title=source.get('title', '')
+        )
+    
+    def _format_batch(self, sources: List[Dict]) -> str:
+        """
+        Format a batch of sources into a single string for the prompt
+        
+        Args:
+            sources: List of scraped content dictionaries
+            
+        Returns:
+            Formatted string
+        """
+        formatted = []
+        
+        for i, source in enumerate(sources, 1):
+            formatted.append(f"""
+Source {i}:
+URL: {source.get('url', 'N/A')}
+Title: {source.get('title', 'Untitled')}
+Content:
+{source.get('content', '')}
+""")
+        
+        return "\n".join(formatted)
 
 # Test function
 async def test_summary_chain():
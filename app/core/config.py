@@ -23,14 +23,44 @@ class Settings(BaseSettings):
     LANGCHAIN_ENDPOINT: str = "https://api.smith.langchain.com"
     LANGCHAIN_PROJECT: str = "research-assistant"
     
+    # Gemini
+    GOOGLE_GENAI_MAX_RETRIES: int = 3  # Attempts per LLM call on transient errors
+    GOOGLE_GENAI_STREAM_ATTEMPTS: int = 2  # Tries per streamed call; restarts only follow a mid-stream break
+    
     # Application Settings
     APP_NAME: str = "AI Research Assistant"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
     
+    # Concurrency
+    MAX_CONCURRENCY: int = 5  # Max parallel searches/scrapes per research task
+    THREAD_POOL_SIZE: int = 64  # Worker threads for blocking I/O across all tasks
+    
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./database/research.db"
     
+    # Summarization
+    SUMMARY_BATCH_SIZE: int = 4  # Sources packed into one summarizer LLM call
+    SUMMARY_BATCH_MAX_TOKENS: int = 24000  # Content budget per batched call
+    SUMMARY_SKIP_THRESHOLD: int = 200  # Pages under this word count are used as-is
+    
+    # Report generation
+    REPORT_MAX_INPUT_TOKENS: int = 16000  # Summaries beyond this are truncated
+    
+    # Semantic cache (reuse summaries of near-duplicate content)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    # Min cosine similarity for a hit. Tuned for Gemini text-embedding-004:
+    # every key starts with the topic, so same-topic pages already score
+    # high - only near-identical copies should clear it
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    
+    # Scraped page cache
+    SCRAPER_CACHE_PATH: str = "./database/scraper_cache.db"
+    
+    # LLM response cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "./database/llm_cache.db"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
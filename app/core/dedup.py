@@ -0,0 +1,59 @@
+"""
+Content Deduplication - Group identical / near-identical documents
+Used to summarize syndicated or mirrored pages only once
+"""
+
+from typing import List, Set
+import hashlib
+
+
+def _shingles(text: str, size: int = 5) -> Set[int]:
+    """Hashed word n-grams of a document"""
+    words = text.lower().split()
+    if len(words) < size:
+        return {hash(tuple(words))}
+    return {hash(tuple(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+def find_duplicates(documents: List[str], threshold: float = 0.85) -> List[int]:
+    """
+    Map each document to the representative of its duplicate group
+    
+    Exact copies are matched by blake2b digest; the rest by Jaccard
+    similarity of 5-word shingles against earlier representatives.
+    
+    Args:
+        documents: Document texts
+        threshold: Minimum shingle Jaccard similarity to count as duplicate
+        
+    Returns:
+        For each document, the index of its representative (itself if unique)
+    """
+    representatives: List[int] = []
+    digests = {}
+    shingle_sets = {}
+    groups = []
+    
+    for i, text in enumerate(documents):
+        # Exact duplicate short-circuit
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        if digest in digests:
+            groups.append(digests[digest])
+            continue
+        
+        shingles = _shingles(text)
+        match = i
+        for rep in representatives:
+            other = shingle_sets[rep]
+            union = len(shingles | other)
+            if union and len(shingles & other) / union >= threshold:
+                match = rep
+                break
+        
+        if match == i:
+            representatives.append(i)
+            shingle_sets[i] = shingles
+            digests[digest] = i
+        groups.append(match)
+    
+    return groups
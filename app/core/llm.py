@@ -2,26 +2,153 @@
 LLM Configuration - Initialize Gemini
 """
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 from app.core.config import settings
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from functools import lru_cache
+from typing import Callable
+import logging
+import os
 
 
-def get_llm():
+log = logging.getLogger("research")
+
+
+# Rough token estimate for English text, used to budget prompt size
+CHARS_PER_TOKEN = 4
+
+# HTTP status codes worth retrying (rate limit / server-side failures)
+_TRANSIENT_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+
+
+# Guard so the global LLM cache is only configured once per process
+_llm_cache_configured = False
+
+
+def _configure_llm_cache():
+    """
+    Enable LangChain's SQLite-backed LLM cache
+
+    Identical prompts (same model, template and inputs) are served from
+    disk instead of making another Gemini round-trip.
+    """
+    global _llm_cache_configured
+    if _llm_cache_configured or not settings.LLM_CACHE_ENABLED:
+        return
+    _llm_cache_configured = True
+
+    try:
+        from langchain_core.globals import set_llm_cache
+        from app.core.llm_cache import HashedSQLiteCache
+    except Exception as e:
+        # Optional dependency - run uncached rather than crash
+        log.warning(f"LLM cache unavailable: {e}")
+        return
+
+    try:
+        cache_dir = os.path.dirname(settings.LLM_CACHE_PATH)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        cache = HashedSQLiteCache(database_path=settings.LLM_CACHE_PATH)
+    except Exception as e:
+        # Unwritable path, locked or corrupt database - same as above
+        log.warning(f"LLM cache disabled ({settings.LLM_CACHE_PATH}): {e}")
+        return
+
+    set_llm_cache(cache)
+
+
+@lru_cache(maxsize=None)
+def get_llm(temperature: float = 0.7):
     """
     Initialize and return Gemini LLM instance
     
     Model: gemini-2.5-flash (good balance of speed and quality)
-    Temperature: 0.7 (creative but not too random)
+    Temperature: 0.7 by default (creative but not too random);
+        pass 0 for deterministic output that caches well
+    
+    Instances are memoized per temperature, so chains share one client.
+    The client retries failed requests itself (backoff on 429/5xx).
     """
+    _configure_llm_cache()
+
     llm = ChatGoogleGenerativeAI(
         model="gemini-2.5-flash",
         google_api_key=settings.GOOGLE_API_KEY,
-        temperature=0.7,
-        convert_system_message_to_human=True  # Gemini-specific setting
+        temperature=temperature,
+        max_retries=settings.GOOGLE_GENAI_MAX_RETRIES
+        # System prompts are sent natively as Gemini's system_instruction
     )
     return llm
 
 
+@lru_cache(maxsize=1)
+def get_embeddings():
+    """
+    Initialize and return the Gemini embeddings model
+    
+    Used for similarity lookups (semantic cache), not generation
+    """
+    return GoogleGenerativeAIEmbeddings(
+        model="models/text-embedding-004",
+        google_api_key=settings.GOOGLE_API_KEY
+    )
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """
+    Check whether an LLM error is worth retrying
+    
+    Timeouts, connection drops, rate limits and 5xx responses are transient;
+    anything else (bad request, output parsing) fails immediately.
+    """
+    while error is not None:
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        code = getattr(error, "code", None) or getattr(error, "status_code", None)
+        if code in _TRANSIENT_STATUS_CODES:
+            return True
+        # LangChain wraps provider errors, so inspect the cause as well
+        error = error.__cause__
+    return False
+
+
+def stream_retrying(stream_started: Callable[[], bool]) -> AsyncRetrying:
+    """
+    Restart policy for streamed Gemini calls
+    
+    The client already retries requests that fail before producing output
+    (max_retries), but can't resume a stream that breaks part-way. Only
+    those are restarted here, up to GOOGLE_GENAI_STREAM_ATTEMPTS times in
+    total. Each restart is a fresh request with its own client retries, so
+    a call makes at most STREAM_ATTEMPTS x MAX_RETRIES requests.
+    
+    Usage:
+        async for attempt in stream_retrying(lambda: bool(parts)):
+            with attempt:
+                ...
+    
+    Args:
+        stream_started: Returns True once the failed attempt produced output
+        
+    Returns:
+        AsyncRetrying with exponential backoff and jitter
+    """
+    return AsyncRetrying(
+        stop=stop_after_attempt(settings.GOOGLE_GENAI_STREAM_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=1, max=10),
+        retry=retry_if_exception(
+            lambda error: stream_started() and _is_transient_error(error)
+        ),
+        reraise=True
+    )
+
+
 # Test function
 async def test_llm_connection():
     """Test if Gemini API is working"""
@@ -36,4 +163,4 @@ async def test_llm_connection():
         return {
             "status": "error",
             "error": str(e)
-        }
\ No newline at end of file
+        }
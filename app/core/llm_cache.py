@@ -0,0 +1,44 @@
+"""
+LLM Cache - SQLite response cache with compact, content-addressed keys
+"""
+
+from langchain_community.cache import SQLiteCache
+from langchain_core.outputs import Generation
+from typing import Optional, Sequence
+import hashlib
+import orjson
+
+
+class HashedSQLiteCache(SQLiteCache):
+    """
+    SQLiteCache keyed by a SHA-256 digest of (model config, prompt)
+
+    The stock cache stores the full prompt text as its primary key, which
+    for report prompts means many kilobytes per row and per index lookup.
+    Hashing keeps every key at 64 characters.
+    """
+
+    @staticmethod
+    def cache_key(prompt: str, llm_string: str) -> str:
+        """
+        Build the cache key for a prompt
+
+        Args:
+            prompt: Serialized prompt sent to the model
+            llm_string: Serialized model configuration (model, temperature, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = {"llm": llm_string, "prompt": prompt}
+        return hashlib.sha256(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """Look up a cached response by hashed key"""
+        return super().lookup(self.cache_key(prompt, llm_string), "")
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """Store a response under its hashed key"""
+        super().update(self.cache_key(prompt, llm_string), "", return_val)
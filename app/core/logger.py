@@ -0,0 +1,43 @@
+"""
+Logging Setup - Non-blocking log output for the research workflow
+Records are queued by the caller and written to stderr on a background thread
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route the "research" logger through a QueueHandler
+    
+    Nodes only enqueue records; a QueueListener drains them to stderr,
+    so concurrent searches/scrapes never block on console writes.
+    Safe to call more than once.
+    
+    Args:
+        level: Minimum log level for the research logger
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    logger = logging.getLogger("research")
+    logger.setLevel(level)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
@@ -0,0 +1,90 @@
+"""
+Semantic Cache - Reuse LLM outputs for near-duplicate inputs
+Matches on embedding cosine similarity rather than exact text
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+
+
+class SemanticCache:
+    """
+    In-memory nearest-neighbour cache over normalized embeddings
+    
+    Inputs whose (topic, content) embedding is within `threshold` cosine
+    similarity of a stored entry reuse that entry's output.
+    """
+    
+    def __init__(self, embedder, threshold: float = 0.95, max_entries: int = 5000):
+        """
+        Initialize the cache
+        
+        Args:
+            embedder: LangChain Embeddings instance
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Oldest entries are dropped beyond this size
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._values: List[str] = []
+    
+    @staticmethod
+    def _key_text(topic: str, content: str) -> str:
+        """Text that gets embedded - the topic plus the start of the content"""
+        return f"{topic}\n{content[:1024]}"
+    
+    async def lookup(self, topic: str, content: str) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """
+        Find a cached output for similar input
+        
+        Args:
+            topic: Research topic
+            content: Source content
+            
+        Returns:
+            (cached output or None, embedding to pass to add() on a miss).
+            The embedding is None if embedding failed.
+        """
+        try:
+            vector = np.asarray(
+                await self.embedder.aembed_query(self._key_text(topic, content)),
+                dtype=np.float32
+            )
+        except Exception:
+            return None, None
+        
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None, None
+        vector /= norm
+        
+        if self._vectors is not None:
+            scores = self._vectors @ vector
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return self._values[best], vector
+        
+        return None, vector
+    
+    def add(self, vector: Optional[np.ndarray], value: str) -> None:
+        """
+        Store an output under the embedding returned by lookup()
+        
+        Args:
+            vector: Normalized embedding from lookup()
+            value: Output to reuse for similar inputs
+        """
+        if vector is None:
+            return
+        
+        if self._vectors is None:
+            self._vectors = vector[np.newaxis, :]
+        else:
+            self._vectors = np.vstack([self._vectors, vector])
+        self._values.append(value)
+        
+        if len(self._values) > self.max_entries:
+            self._vectors = self._vectors[-self.max_entries:]
+            self._values = self._values[-self.max_entries:]
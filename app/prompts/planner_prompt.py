@@ -41,17 +41,20 @@ Format your response as a structured research plan.
 """
 
 
+_PLANNER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", PLANNER_SYSTEM_PROMPT),
+    ("human", PLANNER_TEMPLATE)
+])
+
+
 def get_planner_prompt() -> ChatPromptTemplate:
     """
-    Create the planner prompt template
+    Get the planner prompt template (built once at import)
     
     Returns:
         ChatPromptTemplate with system and user messages
     """
-    return ChatPromptTemplate.from_messages([
-        ("system", PLANNER_SYSTEM_PROMPT),
-        ("human", PLANNER_TEMPLATE)
-    ])
+    return _PLANNER_PROMPT
 
 
 # Alternative: Simple prompt for quick planning
@@ -62,9 +65,12 @@ Make them diverse to cover different aspects.
 Return ONLY the search queries, one per line.
 """
 
+_QUICK_PLANNER_PROMPT = PromptTemplate(
+    input_variables=["topic"],
+    template=QUICK_PLANNER_TEMPLATE
+)
+
+
 def get_quick_planner_prompt() -> PromptTemplate:
     """Quick planner that just returns search queries"""
-    return PromptTemplate(
-        input_variables=["topic"],
-        template=QUICK_PLANNER_TEMPLATE
-    )
\ No newline at end of file
+    return _QUICK_PLANNER_PROMPT
\ No newline at end of file
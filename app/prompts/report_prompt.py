@@ -19,20 +19,14 @@ Guidelines:
 - Cite sources appropriately"""
 
 
+# Static instructions first, dynamic values last: the whole instruction
+# block is then an identical prefix across reports (provider prompt caching).
 REPORT_TEMPLATE = """
-Research Topic: {topic}
-Number of Sources Analyzed: {num_sources}
-
-Source Summaries:
-{summaries}
-
----
-
-Create a comprehensive research report on "{topic}" based on the above summaries.
+Create a comprehensive research report on the research topic given below, based on the source summaries that follow it.
 
 Structure your report as follows:
 
-# {topic}
+# [Research Topic]
 
 ## Executive Summary
 [2-3 paragraphs summarizing key findings]
@@ -52,21 +46,30 @@ Structure your report as follows:
 ## Sources
 [List all sources with titles and URLs]
 
----
-
 Make the report informative, well-organized, and professionally written.
 Use markdown formatting (headers, lists, bold, etc.) for readability.
+
+---
+
+Research Topic: {topic}
+Number of Sources Analyzed: {num_sources}
+
+Source Summaries:
+{summaries}
 """
 
 
+_REPORT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", REPORT_SYSTEM_PROMPT),
+    ("human", REPORT_TEMPLATE)
+])
+
+
 def get_report_prompt() -> ChatPromptTemplate:
     """
-    Create the report generation prompt template
+    Get the report generation prompt template (built once at import)
     
     Returns:
         ChatPromptTemplate for generating final report
     """
-    return ChatPromptTemplate.from_messages([
-        ("system", REPORT_SYSTEM_PROMPT),
-        ("human", REPORT_TEMPLATE)
-    ])
\ No newline at end of file
+    return _REPORT_PROMPT
\ No newline at end of file
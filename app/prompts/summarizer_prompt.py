@@ -15,18 +15,10 @@ Your goals:
 - Highlight novel or surprising findings"""
 
 
+# Static instructions first, dynamic values last: every summarizer call
+# then shares an identical prefix (provider prompt caching).
 SUMMARIZER_TEMPLATE = """
-Research Topic: {topic}
-
-Source URL: {url}
-Source Title: {title}
-
-Content:
-{content}
-
----
-
-Summarize the above content focusing on information relevant to "{topic}".
+Summarize the source content below, focusing on information relevant to the research topic.
 
 Include:
 1. Main points (bullet points)
@@ -35,20 +27,33 @@ Include:
 4. How this relates to the research topic
 
 Keep the summary concise (200-300 words) but informative.
+
+---
+
+Research Topic: {topic}
+
+Source URL: {url}
+Source Title: {title}
+
+Content:
+{content}
 """
 
 
+_SUMMARIZER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SUMMARIZER_SYSTEM_PROMPT),
+    ("human", SUMMARIZER_TEMPLATE)
+])
+
+
 def get_summarizer_prompt() -> ChatPromptTemplate:
     """
-    Create the summarizer prompt template
+    Get the summarizer prompt template (built once at import)
     
     Returns:
         ChatPromptTemplate for summarizing content
     """
-    return ChatPromptTemplate.from_messages([
-        ("system", SUMMARIZER_SYSTEM_PROMPT),
-        ("human", SUMMARIZER_TEMPLATE)
-    ])
+    return _SUMMARIZER_PROMPT
 
 
 # Quick summarizer for shorter content
@@ -60,9 +65,51 @@ Summarize this content in 2-3 sentences focusing on key points relevant to {topi
 {content}
 """
 
+_QUICK_SUMMARIZER_PROMPT = PromptTemplate(
+    input_variables=["topic", "content"],
+    template=QUICK_SUMMARIZER_TEMPLATE
+)
+
+
 def get_quick_summarizer_prompt() -> PromptTemplate:
     """Quick summarizer for brief summaries"""
-    return PromptTemplate(
-        input_variables=["topic", "content"],
-        template=QUICK_SUMMARIZER_TEMPLATE
-    )
\ No newline at end of file
+    return _QUICK_SUMMARIZER_PROMPT
+
+
+# Batch summarizer - several sources in one request
+BATCH_SUMMARIZER_TEMPLATE = """
+For each of the sources below, summarize the content focusing on information relevant to the research topic.
+
+Each summary should include:
+1. Main points (bullet points)
+2. Key facts and statistics
+3. Important insights or conclusions
+4. How this relates to the research topic
+
+Keep each summary concise (200-300 words) but informative.
+
+Return ONLY a JSON object with one key per source - "source_1", "source_2", and so on -
+each mapping to that source's summary as a markdown string.
+
+---
+
+Research Topic: {topic}
+Number of Sources: {num_sources}
+{sources}
+"""
+
+
+_BATCH_SUMMARIZER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SUMMARIZER_SYSTEM_PROMPT),
+    ("human", BATCH_SUMMARIZER_TEMPLATE)
+])
+
+
+def get_batch_summarizer_prompt() -> ChatPromptTemplate:
+    """
+    Get the batch summarizer prompt template (built once at import)
+    
+    Returns:
+        ChatPromptTemplate for summarizing several sources at once
+    """
+    return _BATCH_SUMMARIZER_PROMPT
@@ -4,10 +4,20 @@ Tool Manager - Central place to get all tools
 
 from app.tools.search_tool import create_search_tool, WebSearchTool
 from app.tools.scraper_tool import create_scraper_tool, WebScraperTool
-from typing import List
+from typing import List, Tuple
+from functools import lru_cache
 from langchain.tools import Tool
 
 
+@lru_cache(maxsize=1)
+def _build_tools() -> Tuple[Tool, ...]:
+    """Create each tool once per process"""
+    return (
+        create_search_tool(),
+        create_scraper_tool()
+    )
+
+
 def get_all_tools() -> List[Tool]:
     """
     Get all available tools for the agent
@@ -15,10 +25,7 @@ def get_all_tools() -> List[Tool]:
     Returns:
         List of LangChain Tools
     """
-    return [
-        create_search_tool(),
-        create_scraper_tool()
-    ]
+    return list(_build_tools())
 
 
 def get_tool_by_name(tool_name: str) -> Tool:
@@ -32,8 +39,8 @@ def get_tool_by_name(tool_name: str) -> Tool:
         Tool instance
     """
     tools = {
-        'web_search': create_search_tool(),
-        'web_scraper': create_scraper_tool()
+        'web_search': _build_tools()[0],
+        'web_scraper': _build_tools()[1]
     }
     
     return tools.get(tool_name)
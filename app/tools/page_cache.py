@@ -0,0 +1,155 @@
+"""
+Page Cache - On-disk cache of scraped pages keyed by URL
+Stores validators (ETag / Last-Modified) so stale entries can be revalidated
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+import orjson
+
+
+log = logging.getLogger("research")
+
+
+class PageCache:
+    """
+    Small SQLite-backed cache for parsed scrape results
+    
+    Eviction is by ts - the time an entry was stored or last revalidated,
+    which is also what its freshness is measured from. Plain reads don't
+    bump it, so lookups never write.
+    
+    The cache is best-effort: if the database can't be opened or a query
+    fails, the error is logged and the caller just scrapes uncached.
+    """
+    
+    def __init__(self, path: str, max_entries: int = 1000):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            path: SQLite file path
+            max_entries: Entries kept before the least recently stored or
+                revalidated are evicted
+        """
+        self.max_entries = max_entries
+        
+        # Scrapes run on worker threads, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        try:
+            cache_dir = os.path.dirname(path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            
+            conn = sqlite3.connect(path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pages ("
+                    " key TEXT PRIMARY KEY,"
+                    " etag TEXT,"
+                    " last_modified TEXT,"
+                    " parsed BLOB NOT NULL,"
+                    " ts REAL NOT NULL)"
+                )
+                # Eviction walks entries newest-first
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS pages_ts ON pages (ts)"
+                )
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            log.warning(f"Page cache disabled ({path}): {e}")
+    
+    @staticmethod
+    def key(url: str) -> str:
+        """Compact cache key for a URL"""
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Look up a cached page
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            Dictionary with etag, last_modified, parsed and ts, or None
+        """
+        if self._conn is None:
+            return None
+        
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT etag, last_modified, parsed, ts FROM pages WHERE key = ?",
+                    (self.key(url),)
+                ).fetchone()
+            
+            if row is None:
+                return None
+            
+            return {
+                "etag": row[0],
+                "last_modified": row[1],
+                "parsed": orjson.loads(row[2]),
+                "ts": row[3]
+            }
+        except (sqlite3.Error, ValueError) as e:
+            log.warning(f"Page cache read failed: {e}")
+            return None
+    
+    def put(
+        self,
+        url: str,
+        parsed: Dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Store a parsed page and its validators, evicting old entries
+        
+        Args:
+            url: Page URL
+            parsed: Scrape result dictionary
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        if self._conn is None:
+            return
+        
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                    (self.key(url), etag, last_modified, orjson.dumps(parsed), time.time())
+                )
+                # Drop everything older than the max_entries-th newest entry;
+                # both sides are index range scans, no full-table sort
+                self._conn.execute(
+                    "DELETE FROM pages WHERE ts <"
+                    " (SELECT ts FROM pages ORDER BY ts DESC LIMIT 1 OFFSET ?)",
+                    (self.max_entries - 1,)
+                )
+        except sqlite3.Error as e:
+            log.warning(f"Page cache write failed: {e}")
+    
+    def touch(self, url: str) -> None:
+        """Mark an entry as fresh after a successful revalidation"""
+        if self._conn is None:
+            return
+        
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE pages SET ts = ? WHERE key = ?",
+                    (time.time(), self.key(url))
+                )
+        except sqlite3.Error as e:
+            log.warning(f"Page cache write failed: {e}")
@@ -10,8 +10,11 @@ except Exception:
     # Delay hard failures and provide a fallback in create_search_tool.
     Tool = None
 from app.core.config import settings
-from typing import List, Dict
-import json
+from collections import OrderedDict
+from typing import List, Dict, Tuple
+import orjson
+import threading
+import time
 
 
 class WebSearchTool:
@@ -19,17 +22,33 @@ class WebSearchTool:
     Wrapper for Tavily search optimized for research
     """
     
-    def __init__(self, api_key: str | None = None, max_results: int = 5):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_results: int = 5,
+        cache_ttl: int = 600,
+        cache_size: int = 256,
+    ):
         """Initialize Tavily search.
 
         If no API key is available, the tool will be disabled but
         the module will not crash at import time. This makes it safe
         to import the package in environments where the key isn't set
         (e.g., during local development or unit tests).
+
+        Repeat queries are answered from an in-memory LRU cache for
+        ``cache_ttl`` seconds (0 disables it).
         """
         self._enabled = False
         self._init_error: str | None = None
 
+        # (normalized query, max_results) -> (stored_at, results)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Tuple[str, int], Tuple[float, List[Dict]]] = OrderedDict()
+        # search() runs in worker threads, so guard the cache
+        self._cache_lock = threading.Lock()
+
         resolved_key = api_key or settings.TAVILY_API_KEY
         # Lazy import of TavilySearchResults to avoid import-time errors when the
         # optional dependency isn't installed (e.g., during local dev or in CI).
@@ -90,6 +109,11 @@ class WebSearchTool:
             print(f"WebSearchTool unavailable: {err_msg}")
             return []
 
+        key = (query.strip().casefold(), max_results)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Update max_results
             self.tavily.max_results = max_results
@@ -107,12 +131,43 @@ class WebSearchTool:
                     "score": result.get("score", 0.0)
                 })
             
+            # Don't pin empty result sets - they may be transient
+            if parsed_results:
+                self._cache_put(key, parsed_results)
+            
             return parsed_results
             
         except Exception as e:
             print(f"Search error: {str(e)}")
             return []
     
+    def _cache_get(self, key: Tuple[str, int]) -> List[Dict] | None:
+        """Return a copy of fresh cached results for key, or None"""
+        if self.cache_ttl <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        # Result dicts hold only scalars, so a shallow copy each is a deep copy
+        return [dict(result) for result in results]
+    
+    def _cache_put(self, key: Tuple[str, int], results: List[Dict]) -> None:
+        """Store a private copy of results, evicting the least recently used"""
+        if self.cache_ttl <= 0:
+            return
+        entry = (time.monotonic(), [dict(result) for result in results])
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
     def search_with_context(self, topic: str, context: str = "") -> List[Dict]:
         """
         Search with additional context for better results
@@ -155,7 +210,7 @@ def create_search_tool() -> object:
         return Tool(
             name="web_search",
             description=description,
-            func=lambda query: json.dumps(search_tool.search(query), indent=2),
+            func=lambda query: orjson.dumps(search_tool.search(query), option=orjson.OPT_INDENT_2).decode(),
         )
 
     # Fallback: return a simple object (dict) so code importing create_search_tool
@@ -163,7 +218,7 @@ def create_search_tool() -> object:
     return {
         "name": "web_search",
         "description": description,
-        "func": lambda query: json.dumps(search_tool.search(query), indent=2),
+        "func": lambda query: orjson.dumps(search_tool.search(query), option=orjson.OPT_INDENT_2).decode(),
     }
 
 
@@ -1,6 +1,11 @@
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
+from app.core.logger import setup_logging
 from app.core.llm import test_llm_connection
 from app.tools.search_tool import test_search_tool
 from app.tools.scraper_tool import test_scraper_tool
@@ -9,8 +14,27 @@ from app.chains.planning_chain import test_planning_chain
 from app.chains.summary_chain import test_summary_chain
 from app.chains.report_chain import test_report_chain
 
+setup_logging()
+
+# Shared tool instances - built once, reused by every request
+_SEARCHER = WebSearchTool()
+_SCRAPER = WebScraperTool()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Blocking search/scrape calls run via asyncio.to_thread; size the pool so
+    # concurrent research jobs aren't capped by the small default executor
+    executor = ThreadPoolExecutor(max_workers=settings.THREAD_POOL_SIZE)
+    asyncio.get_running_loop().set_default_executor(executor)
+    yield
+    executor.shutdown(wait=False)
+
+
 app = FastAPI(
     title=settings.APP_NAME,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     description="Autonomous research agent powered by LangGraph & Gemini",
     version=settings.APP_VERSION,
     docs_url="/docs",
@@ -20,21 +44,23 @@ app = FastAPI(
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_credentials=False,  # Lets the middleware send a constant "*" origin
+    allow_methods=["GET"],
     allow_headers=["*"],
 )
 
-# Root
+# Root - payload is static, so build it once at import
+_ROOT_PAYLOAD = {
+    "message": f"Welcome to {settings.APP_NAME}!",
+    "health_check": "OK",
+    "version": f"{settings.APP_VERSION}",
+    "status": "Running",
+    "Docs": "/docs"
+}
+
 @app.get("/", tags=["System"])
 async def root():
-    return {
-        "message": f"Welcome to {settings.APP_NAME}!",
-        "health_check": "OK",
-        "version": f"{settings.APP_VERSION}",
-        "status": "Running",
-        "Docs": "/docs"
-    }
+    return _ROOT_PAYLOAD
 
 # Health
 @app.get("/health", tags=["System"])
@@ -76,20 +102,22 @@ async def test_reporter():
 async def test_research_flow():
     try:
         topic = "latest AI developments 2024"
-        searcher = WebSearchTool()
-        search_results = searcher.search(topic, max_results=3)
+        search_results = await asyncio.to_thread(_SEARCHER.search, topic, 3)
 
         if not search_results:
             return {"error": "No search results found"}
 
+        # Fetch every result concurrently instead of just the top one
+        scraped_pages = await _SCRAPER.scrape_many([r['url'] for r in search_results])
+
         top_result = search_results[0]
-        scraper = WebScraperTool()
-        scraped_content = scraper.scrape(top_result['url'])
+        scraped_content = scraped_pages[0]
 
         return {
             "status": "success",
             "topic": topic,
             "search_results_count": len(search_results),
+            "pages_scraped": sum(1 for page in scraped_pages if page.get('success')),
             "top_result": {
                 "title": top_result['title'],
                 "url": top_result['url'],
@@ -0,0 +1,8 @@
+"""
+Shared test setup
+"""
+
+import os
+
+# Settings() requires a key at import time; tests never call the API
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
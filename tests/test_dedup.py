@@ -0,0 +1,52 @@
+"""
+Tests for near-duplicate document grouping
+"""
+
+from app.core.dedup import find_duplicates
+
+
+ARTICLE = " ".join(f"word{i}" for i in range(200))
+
+
+def test_unique_documents_are_their_own_representatives():
+    docs = [ARTICLE, "completely different text about other things entirely"]
+    assert find_duplicates(docs) == [0, 1]
+
+
+def test_exact_copies_map_to_first_occurrence():
+    docs = ["intro", ARTICLE, "other", ARTICLE, ARTICLE]
+    assert find_duplicates(docs) == [0, 1, 2, 1, 1]
+
+
+def test_near_duplicate_maps_to_earlier_representative():
+    # One changed word out of 200 leaves most 5-word shingles intact
+    near = ARTICLE.replace("word100", "changed")
+    assert find_duplicates([ARTICLE, near]) == [0, 0]
+
+
+def test_near_duplicate_is_case_insensitive():
+    assert find_duplicates([ARTICLE, ARTICLE.upper()]) == [0, 0]
+
+
+def test_dissimilar_overlap_stays_separate():
+    # Sharing half the text is well below the default threshold
+    half = ARTICLE[:len(ARTICLE) // 2] + " " + " ".join(f"other{i}" for i in range(100))
+    assert find_duplicates([ARTICLE, half]) == [0, 1]
+
+
+def test_threshold_controls_matching():
+    half = " ".join(f"word{i}" for i in range(100)) + " " + " ".join(f"x{i}" for i in range(100))
+    assert find_duplicates([ARTICLE, half], threshold=0.85) == [0, 1]
+    assert find_duplicates([ARTICLE, half], threshold=0.2) == [0, 0]
+
+
+def test_near_duplicates_only_match_representatives():
+    # A copy of a duplicate points at the group's representative, not the copy
+    near = ARTICLE.replace("word100", "changed")
+    assert find_duplicates([ARTICLE, near, near]) == [0, 0, 0]
+
+
+def test_short_and_empty_documents():
+    assert find_duplicates([]) == []
+    assert find_duplicates(["", ""]) == [0, 0]
+    assert find_duplicates(["two words", "two words", "other words"]) == [0, 0, 2]
@@ -0,0 +1,104 @@
+"""
+Tests for the on-disk scraped page cache
+"""
+
+import pytest
+
+from app.tools import page_cache
+from app.tools.page_cache import PageCache
+
+
+class _Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(page_cache, "time", clock)
+    return clock
+
+
+def _put(cache, clock, url):
+    clock.now += 1
+    cache.put(url, {"url": url}, etag=f'"{url}"')
+
+
+def _urls(cache, urls):
+    return [url for url in urls if cache.get(url) is not None]
+
+
+def test_round_trip(tmp_path, clock):
+    cache = PageCache(str(tmp_path / "pages.db"))
+    cache.put("u", {"title": "T"}, etag='"e"', last_modified="Mon")
+
+    assert cache.get("u") == {
+        "etag": '"e"',
+        "last_modified": "Mon",
+        "parsed": {"title": "T"},
+        "ts": 1000.0
+    }
+    assert cache.get("missing") is None
+
+
+def test_evicts_oldest_beyond_max_entries(tmp_path, clock):
+    cache = PageCache(str(tmp_path / "pages.db"), max_entries=3)
+    for url in "abcde":
+        _put(cache, clock, url)
+
+    assert _urls(cache, "abcde") == ["c", "d", "e"]
+
+
+def test_touch_protects_revalidated_entry(tmp_path, clock):
+    cache = PageCache(str(tmp_path / "pages.db"), max_entries=2)
+    _put(cache, clock, "a")
+    _put(cache, clock, "b")
+    clock.now += 1
+    cache.touch("a")
+    _put(cache, clock, "c")
+
+    assert _urls(cache, "abc") == ["a", "c"]
+
+
+def test_reads_do_not_affect_eviction(tmp_path, clock):
+    cache = PageCache(str(tmp_path / "pages.db"), max_entries=2)
+    _put(cache, clock, "a")
+    _put(cache, clock, "b")
+    cache.get("a")
+    _put(cache, clock, "c")
+
+    assert _urls(cache, "abc") == ["b", "c"]
+
+
+def test_eviction_uses_ts_index(tmp_path):
+    cache = PageCache(str(tmp_path / "pages.db"))
+    plan = cache._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT ts FROM pages ORDER BY ts DESC LIMIT 1 OFFSET 5"
+    ).fetchall()
+
+    assert any("pages_ts" in row[-1] for row in plan)
+    assert not any("TEMP B-TREE" in row[-1] for row in plan)
+
+
+def test_unopenable_path_disables_cache(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = PageCache(str(blocker / "pages.db"))
+
+    cache.put("u", {"title": "T"})
+    cache.touch("u")
+    assert cache.get("u") is None
+
+
+def test_query_errors_are_swallowed(tmp_path):
+    cache = PageCache(str(tmp_path / "pages.db"))
+    cache._conn.execute("DROP TABLE pages")
+
+    cache.put("u", {"title": "T"})
+    cache.touch("u")
+    assert cache.get("u") is None
@@ -0,0 +1,81 @@
+"""
+Tests for search query extraction from plans
+"""
+
+import random
+import re
+
+import pytest
+
+from app.chains.planning_chain import PlanningChain
+
+
+@pytest.fixture
+def planner():
+    # Skip __init__ - extraction never touches the LLM
+    return PlanningChain.__new__(PlanningChain)
+
+
+def _reference_extract(plan, max_queries):
+    """Line-by-line implementation the regex version replaced"""
+    queries = []
+    for line in plan.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        cleaned = re.sub(r'^[\d\.\-\*\)]+\s*', '', line)
+        cleaned = cleaned.strip('"\'')
+        if cleaned and len(cleaned) < 100 and ':' not in cleaned:
+            queries.append(cleaned)
+        if len(queries) >= max_queries:
+            break
+    return queries
+
+
+def test_extracts_numbered_and_bulleted_lines(planner):
+    plan = (
+        "# Research plan\n"
+        "Search queries:\n"
+        "1. quantum error correction\n"
+        "- \"topological qubits\"\n"
+        "  * superconducting qubit coherence  \n"
+        "\n"
+        "plain query line\n"
+    )
+    assert planner._extract_search_queries(plan, 10) == [
+        "quantum error correction",
+        "topological qubits",
+        "superconducting qubit coherence",
+        "plain query line",
+    ]
+
+
+def test_stops_at_max_queries(planner):
+    plan = "\n".join(f"{i}. query {i}" for i in range(1, 10))
+    assert planner._extract_search_queries(plan, 3) == ["query 1", "query 2", "query 3"]
+
+
+@pytest.mark.parametrize("plan", [
+    "\xa0# Header",
+    "\x0b# h",
+    "\xa0\x0b\t\t)\".",
+    "\r\n1. query\r\n",
+    "　- wide space　",
+    "1.2.3)   \x0c spaced prefix",
+    "x" * 99 + "\n" + "y" * 100,
+])
+def test_matches_reference_on_unusual_whitespace(planner, plan):
+    assert planner._extract_search_queries(plan, 5) == _reference_extract(plan, 5)
+
+
+def test_matches_reference_on_random_plans(planner):
+    alphabet = list(' \t\n\r\x0b\x0c\xa0\x85\x1c　#:"\'.-*)1٣ab') + ['x' * 60]
+    rng = random.Random(0)
+
+    for _ in range(20000):
+        plan = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        max_queries = rng.randint(1, 6)
+        assert (
+            planner._extract_search_queries(plan, max_queries)
+            == _reference_extract(plan, max_queries)
+        ), repr(plan)
@@ -0,0 +1,130 @@
+"""
+Tests for report prompt budgeting, streaming and word counting
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.caches import BaseCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.output_parsers import StrOutputParser
+
+from app.chains.report_chain import ReportChain
+from app.prompts.report_prompt import get_report_prompt
+
+
+@pytest.fixture
+def reporter():
+    # Skip __init__ - these tests never build the LLM chain
+    return ReportChain.__new__(ReportChain)
+
+
+class TestSummaryCharCaps:
+
+    def test_everything_fits(self, reporter):
+        lengths = {1: 100, 2: 200, 3: 300}
+        assert reporter._summary_char_caps(lengths, 1000) == lengths
+
+    def test_exact_budget_keeps_full_lengths(self, reporter):
+        lengths = {1: 100, 2: 200}
+        assert reporter._summary_char_caps(lengths, 300) == lengths
+
+    def test_short_summaries_donate_unused_share(self, reporter):
+        # Fair share is 300 each; the short one keeps 100 and the
+        # other two split the remaining 800
+        caps = reporter._summary_char_caps({1: 1000, 2: 100, 3: 1000}, 900)
+        assert caps == {1: 400, 2: 100, 3: 400}
+
+    def test_only_longest_are_truncated(self, reporter):
+        caps = reporter._summary_char_caps({1: 50, 2: 250, 3: 5000}, 1000)
+        assert caps == {1: 50, 2: 250, 3: 700}
+
+    def test_never_exceeds_budget(self, reporter):
+        lengths = {i: 97 * i for i in range(1, 12)}
+        for budget in (0, 1, 10, 333, 1000, 5000):
+            caps = reporter._summary_char_caps(lengths, budget)
+            assert sum(caps.values()) <= budget
+            assert all(caps[i] <= lengths[i] for i in lengths)
+
+    def test_no_summaries(self, reporter):
+        assert reporter._summary_char_caps({}, 1000) == {}
+
+
+class TestTruncateSummary:
+
+    def test_fits_unchanged(self, reporter):
+        assert reporter._truncate_summary("short text", 10) == "short text"
+
+    def test_keeps_head_and_tail_on_word_boundaries(self, reporter):
+        text = " ".join(f"w{i}" for i in range(100))
+        result = reporter._truncate_summary(text, 60)
+        head, tail = result.split(" ...[truncated]... ")
+
+        assert text.startswith(head)
+        assert text.endswith(tail)
+        # No word is cut in half
+        assert set(head.split()) <= set(text.split())
+        assert set(tail.split()) <= set(text.split())
+        assert len(head) + len(tail) <= 60
+
+
+def _report_with_chunks(reporter, chunks):
+    """Run generate_report over a canned stream"""
+    async def fake_stream(topic, summaries):
+        for chunk in chunks:
+            yield chunk
+
+    reporter.stream_report = fake_stream
+    return asyncio.run(reporter.generate_report("topic", []))
+
+
+@pytest.mark.parametrize("chunks", [
+    ["Hello world"],
+    ["Hel", "lo wor", "ld"],
+    ["Hello ", "world"],
+    ["Hello", " world"],
+    ["Hello", "", " ", "\n", "world"],
+    ["  leading", " and trailing  "],
+    ["a", "b", "c", " d", "e "],
+    ["one\ntwo", "\tthree", "four"],
+    [],
+])
+def test_generate_report_counts_words_across_chunk_boundaries(reporter, chunks):
+    result = _report_with_chunks(reporter, chunks)
+
+    assert result["success"]
+    assert result["report"] == "".join(chunks)
+    assert result["word_count"] == len("".join(chunks).split())
+
+
+class _BrokenCache(BaseCache):
+    """LLM cache whose database is unavailable"""
+
+    def lookup(self, prompt, llm_string):
+        raise OSError("database is locked")
+
+    def update(self, prompt, llm_string, return_val):
+        raise OSError("database is locked")
+
+    def clear(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def broken_llm_cache():
+    previous = get_llm_cache()
+    set_llm_cache(_BrokenCache())
+    yield
+    set_llm_cache(previous)
+
+
+def test_stream_report_survives_cache_errors(reporter, broken_llm_cache):
+    reporter.prompt = get_report_prompt()
+    reporter.llm = GenericFakeChatModel(messages=iter(["The report"]))
+    reporter.chain = reporter.prompt | reporter.llm | StrOutputParser()
+
+    async def collect():
+        return [chunk async for chunk in reporter.stream_report("topic", [])]
+
+    assert "".join(asyncio.run(collect())) == "The report"
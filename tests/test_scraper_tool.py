@@ -0,0 +1,210 @@
+"""
+Tests for scraped page parsing and redirect guarding (no network access)
+"""
+
+import asyncio
+import socket
+
+import httpx
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from app.tools.scraper_tool import WebScraperTool, _ScrapeError
+
+
+@pytest.fixture
+def scraper():
+    return WebScraperTool(use_cache=False)
+
+
+HTML = (
+    '<html><head><meta charset="windows-1252"><title>Café</title></head>'
+    '<body><nav>menu</nav><main><p>café — ok</p></main></body></html>'
+)
+
+
+def test_header_charset_overrides_meta_charset(scraper):
+    result = scraper._parse_page("u", HTML.encode("utf-8"), 200, "utf-8")
+    assert result["content"] == "café — ok"
+
+
+def test_non_utf8_header_charset_is_decoded(scraper):
+    body = HTML.replace("—", "-").encode("windows-1252")
+    result = scraper._parse_page("u", body, 200, "windows-1252")
+    assert result["title"] == "Café"
+    assert result["content"] == "café - ok"
+
+
+@pytest.mark.parametrize("content_type, charset", [
+    ("text/html", None),
+    ("text/html; charset=utf-8", "utf-8"),
+    ('text/html; Charset="ISO-8859-1"', "ISO-8859-1"),
+    ("text/html; boundary=x; charset=koi8-r", "koi8-r"),
+    ("text/html; charset=", None),
+])
+def test_header_charset(content_type, charset):
+    assert WebScraperTool._header_charset(content_type) == charset
+
+
+def test_parse_page_strips_boilerplate_and_counts_words(scraper):
+    result = scraper._parse_page("u", HTML.encode("utf-8"), 200, "utf-8")
+    assert "menu" not in result["content"]
+    assert result["word_count"] == 3
+
+
+def test_blank_lines_are_dropped(scraper):
+    body = b"<html><body><main><p>  one </p>\n\n<div> </div><p>two</p></main></body></html>"
+    result = scraper._parse_page("u", body, 200, "utf-8")
+    assert result["content"] == "one\ntwo"
+
+
+def _resolve_to(monkeypatch, address):
+    monkeypatch.setattr(
+        socket, "getaddrinfo",
+        lambda host, port: [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, 0))]
+    )
+
+
+@pytest.mark.parametrize("address", ["127.0.0.1", "10.1.2.3", "169.254.169.254", "::1", "fe80::1%eth0"])
+def test_private_hosts_are_refused(scraper, monkeypatch, address):
+    _resolve_to(monkeypatch, address)
+    assert scraper._check_public_host("example.com").startswith("Refusing")
+
+
+def test_public_host_is_allowed(scraper, monkeypatch):
+    _resolve_to(monkeypatch, "93.184.216.34")
+    assert scraper._check_public_host("example.com") is None
+
+
+def _guard_by_hostname(scraper):
+    """Treat every host named 'internal' as private, without DNS"""
+    scraper._check_public_host = lambda hostname: (
+        "Refusing to fetch non-public address: 10.0.0.1" if hostname == "internal" else None
+    )
+
+
+class _FakeResponse:
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("content_type", [
+    "text/html",
+    "text/html; charset=utf-8",
+    "Application/XHTML+xml",
+])
+def test_html_content_types_are_accepted(scraper, content_type):
+    scraper._check_response(_FakeResponse(200, {"Content-Type": content_type}))
+
+
+@pytest.mark.parametrize("content_type", [
+    "",
+    "application/pdf",
+    "text/plain; x=html",
+    "application/vnd.html-ish",
+])
+def test_other_content_types_are_refused(scraper, content_type):
+    with pytest.raises(_ScrapeError, match="Unsupported content type"):
+        scraper._check_response(_FakeResponse(200, {"Content-Type": content_type}))
+
+
+def test_empty_body_is_refused(scraper):
+    with pytest.raises(_ScrapeError, match="Empty response body"):
+        scraper._finish("u", bytearray(), 200, {"content-type": "text/html"})
+
+
+def test_open_checks_every_redirect_hop(scraper):
+    _guard_by_hostname(scraper)
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return _FakeResponse(302, {"Location": "http://internal/admin"})
+
+    scraper.session.get = fake_get
+
+    with pytest.raises(_ScrapeError, match="non-public"):
+        scraper._open("http://example.com/", {})
+    assert requested == ["http://example.com/"]
+
+
+def test_open_follows_relative_redirects(scraper):
+    _guard_by_hostname(scraper)
+    responses = {
+        "http://example.com/a": _FakeResponse(301, {"Location": "/b"}),
+        "http://example.com/b": _FakeResponse(200),
+    }
+    scraper.session.get = lambda url, **kwargs: responses[url]
+
+    assert scraper._open("http://example.com/a", {}) is responses["http://example.com/b"]
+    assert responses["http://example.com/a"].closed
+
+
+def test_open_limits_redirects(scraper):
+    _guard_by_hostname(scraper)
+    scraper.session.get = lambda url, **kwargs: _FakeResponse(302, {"Location": url})
+
+    with pytest.raises(_ScrapeError, match="redirects"):
+        scraper._open("http://example.com/", {})
+
+
+def _fetch(scraper, url, handler, follow_redirects=False):
+    """Run _fetch against a mocked transport"""
+    async def run():
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            follow_redirects=follow_redirects
+        ) as client:
+            return await scraper._fetch(client, url, asyncio.Semaphore(1))
+
+    return asyncio.run(run())
+
+
+def _page(request):
+    return httpx.Response(
+        200,
+        headers={"Content-Type": "text/html; charset=utf-8"},
+        content=b"<html><body><main>async page</main></body></html>"
+    )
+
+
+@pytest.mark.parametrize("follow_redirects", [False, True])
+def test_fetch_refuses_redirect_to_private_host(scraper, follow_redirects):
+    _guard_by_hostname(scraper)
+
+    def handler(request):
+        if request.url.host == "internal":
+            return _page(request)
+        return httpx.Response(302, headers={"Location": "http://internal/"})
+
+    result = _fetch(scraper, "http://example.com/", handler, follow_redirects)
+    assert not result["success"]
+    assert "non-public" in result["error"]
+
+
+def test_fetch_retries_transient_statuses(scraper):
+    _guard_by_hostname(scraper)
+    scraper.RETRY_BACKOFF = 0
+    statuses = iter([503, 429])
+
+    def handler(request):
+        status = next(statuses, None)
+        return httpx.Response(status) if status else _page(request)
+
+    result = _fetch(scraper, "http://example.com/", handler)
+    assert result["success"]
+    assert result["content"] == "async page"
+
+
+def test_fetch_gives_up_after_max_retries(scraper):
+    _guard_by_hostname(scraper)
+    scraper.RETRY_BACKOFF = 0
+
+    result = _fetch(scraper, "http://example.com/", lambda request: httpx.Response(503))
+    assert result == {"success": False, "error": "Request failed: HTTP 503"}
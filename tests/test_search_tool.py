@@ -0,0 +1,98 @@
+"""
+Tests for the search result cache (no network access)
+"""
+
+import pytest
+
+from app.tools import search_tool
+from app.tools.search_tool import WebSearchTool
+
+
+class _FakeTavily:
+
+    def __init__(self):
+        self.max_results = 5
+        self.queries = []
+
+    def invoke(self, inputs):
+        self.queries.append(inputs["query"])
+        return [{"url": f"https://example.com/{len(self.queries)}", "title": "t"}]
+
+
+class _Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(search_tool, "time", clock)
+    return clock
+
+
+def _tool(**kwargs):
+    tool = WebSearchTool(api_key="test-key", **kwargs)
+    tool.tavily = _FakeTavily()
+    tool._enabled = True
+    return tool
+
+
+def test_repeat_query_is_served_from_cache(clock):
+    tool = _tool()
+    first = tool.search("Quantum computing")
+    second = tool.search("  quantum COMPUTING ")
+
+    assert second == first
+    assert tool.tavily.queries == ["Quantum computing"]
+
+
+def test_cached_results_are_copies(clock):
+    tool = _tool()
+    tool.search("q")[0]["url"] = "mutated"
+
+    assert tool.search("q")[0]["url"] == "https://example.com/1"
+
+
+def test_max_results_is_part_of_the_key(clock):
+    tool = _tool()
+    tool.search("q", max_results=3)
+    tool.search("q", max_results=5)
+
+    assert len(tool.tavily.queries) == 2
+
+
+def test_entries_expire_after_ttl(clock):
+    tool = _tool(cache_ttl=60)
+    tool.search("q")
+    clock.now += 60
+    tool.search("q")
+    clock.now += 61
+    tool.search("q")
+
+    assert len(tool.tavily.queries) == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    tool = _tool(cache_size=2)
+    tool.search("a")
+    tool.search("b")
+    tool.search("a")  # refreshes a, so b is now the oldest
+    tool.search("c")
+
+    tool.search("a")
+    assert tool.tavily.queries == ["a", "b", "c"]
+    tool.search("b")
+    assert tool.tavily.queries == ["a", "b", "c", "b"]
+
+
+def test_zero_ttl_disables_cache(clock):
+    tool = _tool(cache_ttl=0)
+    tool.search("q")
+    tool.search("q")
+
+    assert len(tool.tavily.queries) == 2
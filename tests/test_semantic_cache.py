@@ -0,0 +1,99 @@
+"""
+Tests for the embedding-similarity summary cache
+"""
+
+import asyncio
+
+import numpy as np
+
+from app.core.semantic_cache import SemanticCache
+
+
+class _StubEmbedder:
+    """Maps the first word of the content to a fixed vector"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    async def aembed_query(self, text):
+        self.calls += 1
+        content = text.split("\n", 1)[1]
+        return self.vectors[content.split()[0]]
+
+
+class _FailingEmbedder:
+
+    async def aembed_query(self, text):
+        raise RuntimeError("quota exceeded")
+
+
+VECTORS = {
+    "cats": [1.0, 0.0, 0.0],
+    "kittens": [0.99, 0.1, 0.0],  # cosine ~0.995 with cats
+    "dogs": [0.6, 0.8, 0.0],  # cosine 0.6 with cats
+    "birds": [0.0, 0.0, 2.0],
+    "zero": [0.0, 0.0, 0.0],
+}
+
+
+def _lookup(cache, content):
+    return asyncio.run(cache.lookup("topic", content))
+
+
+def test_miss_then_hit_on_similar_content():
+    cache = SemanticCache(_StubEmbedder(VECTORS), threshold=0.95)
+
+    value, vector = _lookup(cache, "cats are great")
+    assert value is None
+    cache.add(vector, "summary about cats")
+
+    value, _ = _lookup(cache, "kittens are great")
+    assert value == "summary about cats"
+
+
+def test_dissimilar_content_misses():
+    cache = SemanticCache(_StubEmbedder(VECTORS), threshold=0.95)
+    cache.add(_lookup(cache, "cats")[1], "summary about cats")
+
+    value, vector = _lookup(cache, "dogs")
+    assert value is None
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+
+
+def test_returns_closest_entry():
+    cache = SemanticCache(_StubEmbedder(VECTORS), threshold=0.5)
+    cache.add(_lookup(cache, "dogs")[1], "dogs")
+    cache.add(_lookup(cache, "cats")[1], "cats")
+
+    assert _lookup(cache, "kittens")[0] == "cats"
+
+
+def test_oldest_entries_are_evicted():
+    cache = SemanticCache(_StubEmbedder(VECTORS), threshold=0.95, max_entries=2)
+    for word in ("cats", "dogs", "birds"):
+        cache.add(_lookup(cache, word)[1], word)
+
+    assert cache._values == ["dogs", "birds"]
+    assert cache._vectors.shape == (2, 3)
+    assert _lookup(cache, "cats")[0] is None
+    assert _lookup(cache, "birds")[0] == "birds"
+
+
+def test_embedding_failure_is_a_miss():
+    cache = SemanticCache(_FailingEmbedder())
+    assert _lookup(cache, "cats") == (None, None)
+
+    # Nothing to store without an embedding
+    cache.add(None, "summary")
+    assert cache._values == []
+
+
+def test_zero_vector_is_a_miss():
+    cache = SemanticCache(_StubEmbedder(VECTORS))
+    assert _lookup(cache, "zero") == (None, None)
+
+
+def test_key_uses_topic_and_content_prefix():
+    text = SemanticCache._key_text("topic", "x" * 5000)
+    assert text == "topic\n" + "x" * 1024